@@ -6,7 +6,9 @@ from ch_tools.chadmin.internal.table_replica import (
     get_table_replica,
     list_table_replicas,
     restart_table_replica,
+    restart_table_replicas,
     restore_table_replica,
+    restore_table_replicas,
 )
 from ch_tools.common import logging
 from ch_tools.common.cli.formatting import print_response
@@ -147,6 +149,13 @@ def list_command(ctx, **kwargs):
     is_flag=True,
     help="Restart replicas on all hosts of the cluster.",
 )
+@option(
+    "-w",
+    "--max-workers",
+    type=int,
+    default=1,
+    help="Max number of replicas processed concurrently. Ignored in dry run mode.",
+)
 @option(
     "-n",
     "--dry-run",
@@ -155,19 +164,24 @@ def list_command(ctx, **kwargs):
     help="Enable dry run mode and do not perform any modifying actions.",
 )
 @pass_context
-def restart_replica_command(ctx, on_cluster, dry_run, **kwargs):
+def restart_replica_command(ctx, _all, on_cluster, max_workers, dry_run, **kwargs):
     """
     Restart one or several table replicas.
     """
     cluster = get_cluster_name(ctx) if on_cluster else None
-    for replica in list_table_replicas(ctx, **kwargs):
-        restart_table_replica(
-            ctx,
-            replica["database"],
-            replica["table"],
-            cluster=cluster,
-            dry_run=dry_run,
-        )
+    replicas = list_table_replicas(ctx, **kwargs)
+    failed = restart_table_replicas(
+        ctx, replicas, cluster=cluster, dry_run=dry_run, max_workers=max_workers
+    )
+    if failed:
+        for replica, error in failed:
+            logging.error(
+                "Failed to restart replica `{}`.`{}`: {}",
+                replica["database"],
+                replica["table"],
+                error,
+            )
+        raise failed[0][1]
 
 
 @replica_group.command("restore")
@@ -214,6 +228,13 @@ def restart_replica_command(ctx, on_cluster, dry_run, **kwargs):
     is_flag=True,
     help="Restore replicas on all hosts of the cluster.",
 )
+@option(
+    "-w",
+    "--max-workers",
+    type=int,
+    default=1,
+    help="Max number of replicas processed concurrently. Ignored in dry run mode.",
+)
 @option(
     "-n",
     "--dry-run",
@@ -222,53 +243,52 @@ def restart_replica_command(ctx, on_cluster, dry_run, **kwargs):
     help="Enable dry run mode and do not perform any modifying actions.",
 )
 @pass_context
-def restore_command(ctx, _all, on_cluster, dry_run, **kwargs):
+def restore_command(ctx, _all, on_cluster, max_workers, dry_run, **kwargs):
     """
     Restore one or several table replicas.
     """
     cluster = get_cluster_name(ctx) if on_cluster else None
     ro_replicas = list_table_replicas(ctx, is_readonly=True, **kwargs)
-    for replica in ro_replicas:
-        try:
-            restore_table_replica(
-                ctx,
-                replica["database"],
-                replica["table"],
-                cluster=cluster,
-                dry_run=dry_run,
+    failed = restore_table_replicas(
+        ctx, ro_replicas, cluster=cluster, dry_run=dry_run, max_workers=max_workers
+    )
+    unrecoverable = []
+    for replica, error in failed:
+        msg = error.response.text
+        if "Replica has metadata in ZooKeeper" in msg or "NO_ZOOKEEPER" in msg:
+            logging.warning(
+                'Failed to restore replica with error "{}", attempting to recover by restarting replica and retrying restore',
+                msg,
             )
-        except ClickhouseError as e:
-            msg = e.response.text
-            if "Replica has metadata in ZooKeeper" in msg or "NO_ZOOKEEPER" in msg:
-                logging.warning(
-                    'Failed to restore replica with error "{}", attempting to recover by restarting replica and retrying restore',
-                    msg,
-                )
-                restart_table_replica(
-                    ctx,
-                    replica["database"],
-                    replica["table"],
-                    cluster=cluster,
-                    dry_run=dry_run,
-                )
-                restore_table_replica(
-                    ctx,
-                    replica["database"],
-                    replica["table"],
-                    cluster=cluster,
-                    dry_run=dry_run,
-                )
-            elif "Replica path is present" in msg:
-                logging.warning(
-                    'Failed to restore replica with error "{}", attempting to recover by restarting replica',
-                    msg,
-                )
-                restart_table_replica(
+            recovery_steps = [restart_table_replica, restore_table_replica]
+        elif "Replica path is present" in msg:
+            logging.warning(
+                'Failed to restore replica with error "{}", attempting to recover by restarting replica',
+                msg,
+            )
+            recovery_steps = [restart_table_replica]
+        else:
+            recovery_steps = []
+
+        try:
+            if not recovery_steps:
+                raise error
+            for step in recovery_steps:
+                step(
                     ctx,
                     replica["database"],
                     replica["table"],
                     cluster=cluster,
                     dry_run=dry_run,
                 )
-            else:
-                raise
+        except ClickhouseError as e:
+            logging.error(
+                "Failed to restore replica `{}`.`{}`: {}",
+                replica["database"],
+                replica["table"],
+                e,
+            )
+            unrecoverable.append(e)
+
+    if unrecoverable:
+        raise unrecoverable[0]
@@ -1,3 +1,5 @@
+import json
+
 from click import ClickException
 
 from ch_tools.chadmin.internal.utils import execute_query
@@ -29,7 +31,17 @@ def list_processes(
 ):
     """
     Get list of executing queries from system.processes table.
+
+    Cancellation status, written data, client info, profile events and settings are
+    returned in verbose mode only.
     """
+    query_pattern_match = None
+    if query_pattern:
+        query_pattern_match, query_pattern = _parse_like_pattern(query_pattern)
+        if query_pattern_match == "contains" and not query_pattern:
+            # Patterns consisting of "%" only match any query, so no filter is needed.
+            query_pattern = None
+
     query = """
         SELECT
         {% if cluster %}
@@ -38,19 +50,23 @@ def list_processes(
              query_id,
              elapsed,
              query,
+        {% if verbose %}
              is_cancelled,
+        {% endif %}
              concat(toString(read_rows), ' rows / ', formatReadableSize(read_bytes)) "read",
+        {% if verbose %}
              concat(toString(written_rows), ' rows / ', formatReadableSize(written_bytes)) "written",
+        {% endif %}
              formatReadableSize(memory_usage) "memory usage",
+        {% if not verbose %}
+             user
+        {% else %}
              user,
              multiIf(empty(client_name),
                      http_user_agent,
                      concat(client_name, ' ',
                             toString(client_version_major), '.',
                             toString(client_version_minor), '.',
-        {% if not verbose %}
-                            toString(client_version_patch))) "client"
-        {% else %}
                             toString(client_version_patch))) "client",
         ProfileEvents,
         Settings
@@ -61,22 +77,34 @@ def list_processes(
         FROM system.processes
         {% endif %}
         WHERE 1
+        {% if query_id %}
+          AND query_id = {query_id:String}
+        {% endif %}
         {% if user %}
-          AND user = '{{ user }}'
+          AND user = {user:String}
         {% endif %}
         {% if exclude_user %}
-          AND user != '{{ exclude_user }}'
-        {% endif %}
-        {% if query_id %}
-          AND query_id = '{{ query_id }}'
+          AND user != {exclude_user:String}
         {% endif %}
         {% if query_pattern %}
-          AND lower(query) LIKE lower('{{ query_pattern }}')
+        {% if query_pattern_match == "contains" %}
+          AND positionCaseInsensitive(query, {query_pattern:String}) > 0
+        {% elif query_pattern_match == "prefix" %}
+          AND startsWith(lower(query), lower({query_pattern:String}))
+        {% elif query_pattern_match == "suffix" %}
+          AND endsWith(lower(query), lower({query_pattern:String}))
+        {% elif query_pattern_match == "equals" %}
+          AND lower(query) = lower({query_pattern:String})
+        {% else %}
+          AND lower(query) LIKE lower({query_pattern:String})
+        {% endif %}
         {% endif %}
         {% if not query_id %}
         ORDER BY {{ order_by }} DESC
         {% endif %}
-        {% if limit %}
+        {% if query_id and not cluster %}
+        LIMIT 1
+        {% elif limit %}
         LIMIT {{ limit }}
         {% endif %}
         """
@@ -87,11 +115,18 @@ def list_processes(
         exclude_user=exclude_user,
         query_id=query_id,
         query_pattern=query_pattern,
+        query_pattern_match=query_pattern_match,
         cluster=cluster,
         limit=limit,
         verbose=verbose,
         order_by=order_by,
         format_="JSON",
+        query_params=_query_params(
+            user=user,
+            exclude_user=exclude_user,
+            query_id=query_id,
+            query_pattern=query_pattern,
+        ),
     )["data"]
 
 
@@ -102,21 +137,65 @@ def kill_process(ctx, query_id=None, user=None, exclude_user=None):
     query_str = """
         KILL QUERY
         WHERE 1
+        {% if query_id %}
+          AND query_id = {query_id:String}
+        {% endif %}
         {% if user %}
-          AND user = '{{ user }}'
+          AND user = {user:String}
         {% endif %}
         {% if exclude_user %}
-          AND user != '{{ exclude_user }}'
-        {% endif %}
-        {% if query_id %}
-          AND query_id = '{{ query_id }}'
+          AND user != {exclude_user:String}
         {% endif %}
         """
-    logging.info(
-        execute_query(
-            ctx, query_str, query_id=query_id, user=user, exclude_user=exclude_user
-        )
-    )
+    with execute_query(
+        ctx,
+        query_str,
+        query_id=query_id,
+        user=user,
+        exclude_user=exclude_user,
+        query_params=_query_params(
+            query_id=query_id, user=user, exclude_user=exclude_user
+        ),
+        format_="JSONEachRow",
+        stream=True,
+    ) as response:
+        for line in response.iter_lines():
+            process = json.loads(line)
+            logging.info(
+                "Query {} of user {}: {}",
+                process["query_id"],
+                process["user"],
+                process["kill_status"],
+            )
+
+
+def _query_params(**kwargs):
+    """
+    Return query parameters with specified values.
+    """
+    return {name: value for name, value in kwargs.items() if value}
+
+
+def _parse_like_pattern(pattern):
+    """
+    Detect LIKE patterns that can be evaluated with cheaper string functions.
+
+    :returns tuple (match type, value to match). Match type is one of "contains",
+      "prefix", "suffix", "equals" or "like" for patterns that require LIKE evaluation.
+    """
+    needle = pattern.strip("%")
+    if any(char in needle for char in "%_\\"):
+        return "like", pattern
+
+    leading = pattern.startswith("%")
+    trailing = pattern.endswith("%")
+    if leading and trailing:
+        return "contains", needle
+    if trailing:
+        return "prefix", needle
+    if leading:
+        return "suffix", needle
+    return "equals", needle
 
 
 def list_merges(
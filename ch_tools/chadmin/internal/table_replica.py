@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from click import ClickException
 
 from ch_tools.chadmin.internal.utils import execute_query
+from ch_tools.common.clickhouse.client import ClickhouseError
 
 
 def get_table_replica(ctx, database_name, table_name):
@@ -35,17 +38,19 @@ def list_table_replicas(
 ):
     """
     List replicas of replicated tables.
+
+    Only database and table names are returned unless verbose is set.
     """
     query = """
         SELECT
             database,
+        {% if not verbose -%}
+            table
+        {% else -%}
             table,
             engine,
             zookeeper_path,
             replica_name,
-        {% if not verbose -%}
-            replica_path
-        {% else -%}
             replica_path,
             is_leader,
             can_become_leader,
@@ -134,3 +139,77 @@ def restore_table_replica(
     if cluster:
         query += f" ON CLUSTER '{cluster}'"
     execute_query(ctx, query, timeout=timeout, echo=True, dry_run=dry_run, format_=None)
+
+
+def restart_table_replicas(
+    ctx,
+    replicas,
+    *,
+    cluster=None,
+    dry_run=False,
+    max_workers=1,
+):
+    """
+    Perform "SYSTEM RESTART REPLICA" for the specified replicas of replicated tables.
+
+    Queries are executed concurrently by max_workers threads (sequentially in dry run
+    mode). Return list of (replica, error) pairs for replicas that failed to restart.
+    """
+    return _execute_for_replicas(
+        ctx,
+        restart_table_replica,
+        replicas,
+        cluster=cluster,
+        dry_run=dry_run,
+        max_workers=max_workers,
+    )
+
+
+def restore_table_replicas(
+    ctx,
+    replicas,
+    *,
+    cluster=None,
+    dry_run=False,
+    max_workers=1,
+):
+    """
+    Perform "SYSTEM RESTORE REPLICA" for the specified replicas of replicated tables.
+
+    Queries are executed concurrently by max_workers threads (sequentially in dry run
+    mode). Return list of (replica, error) pairs for replicas that failed to restore.
+    """
+    return _execute_for_replicas(
+        ctx,
+        restore_table_replica,
+        replicas,
+        cluster=cluster,
+        dry_run=dry_run,
+        max_workers=max_workers,
+    )
+
+
+def _execute_for_replicas(ctx, func, replicas, *, cluster, dry_run, max_workers):
+    # ClickHouse HTTP interface does not allow multi-statement queries, so round trips
+    # are amortized by running them in parallel instead.
+    def _execute(replica):
+        try:
+            func(
+                ctx,
+                replica["database"],
+                replica["table"],
+                cluster=cluster,
+                dry_run=dry_run,
+            )
+        except ClickhouseError as e:
+            return replica, e
+        return None
+
+    # Echoed queries of concurrent workers would interleave in dry run output.
+    if dry_run or max_workers <= 1:
+        results = [_execute(replica) for replica in replicas]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_execute, replicas))
+
+    return [result for result in results if result is not None]
@@ -3,12 +3,19 @@ Utility functions.
 """
 import re
 import subprocess
+import threading
+from concurrent.futures import Future
+from copy import deepcopy
 from itertools import islice
-from typing import Iterable, Iterator
+from typing import Any, Dict, Iterable, Iterator
 
 from ch_tools.common import logging
 from ch_tools.common.clickhouse.client.clickhouse_client import clickhouse_client
 
+# In-flight SELECT queries used to coalesce concurrent identical requests.
+_inflight_queries: Dict[Any, Future] = {}
+_inflight_queries_lock = threading.Lock()
+
 
 def execute_query(
     ctx,
@@ -19,24 +26,79 @@ def execute_query(
     format_="default",
     stream=False,
     settings=None,
+    query_params=None,
     **kwargs,
 ):
     """
     Execute ClickHouse query.
+
+    Keyword arguments are passed to the query template. Values that come from user input
+    should be passed through query_params and referenced in the query as query
+    parameters ("{<name>:<data type>}").
+
+    Concurrent executions of the same SELECT query share a single request to ClickHouse.
     """
     if format_ == "default":
         format_ = "PrettyCompact"
 
-    return clickhouse_client(ctx).query(
-        query=query,
-        query_args=kwargs,
-        timeout=timeout,
-        format_=format_,
-        echo=echo,
-        dry_run=dry_run,
-        stream=stream,
-        settings=settings,
+    client = clickhouse_client(ctx)
+    if kwargs:
+        query = client.render_query(query, **kwargs)
+
+    def _execute():
+        return client.query(
+            query=query,
+            timeout=timeout,
+            format_=format_,
+            echo=echo,
+            dry_run=dry_run,
+            stream=stream,
+            settings=settings,
+            query_params=query_params,
+        )
+
+    if stream or echo or dry_run or not _is_select_query(query):
+        return _execute()
+
+    key = (
+        id(client),
+        query,
+        format_,
+        timeout,
+        _freeze(settings),
+        _freeze(query_params),
     )
+    with _inflight_queries_lock:
+        future = _inflight_queries.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_queries[key] = future
+
+    if not is_owner:
+        return deepcopy(future.result())
+
+    try:
+        result = _execute()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_queries_lock:
+            del _inflight_queries[key]
+
+
+def _is_select_query(query):
+    words = query.split(None, 1)
+    return bool(words) and words[0].upper() in ("SELECT", "WITH")
+
+
+def _freeze(value):
+    if not value:
+        return None
+    return tuple(sorted(value.items()))
 
 
 def format_query(query):
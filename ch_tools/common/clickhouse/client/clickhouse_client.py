@@ -1,6 +1,7 @@
 import json
 import subprocess
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
@@ -23,6 +24,8 @@ PORTS_PRIORITY = [
     ClickhousePort.TCP,
 ]
 
+TEMPLATE_CACHE_SIZE = 128
+
 
 class ClickhouseClient:
     """
@@ -50,6 +53,9 @@ class ClickhouseClient:
         self._settings = settings or {}
         self._timeout = timeout
         self._ch_version = None
+        self._compile_template = lru_cache(maxsize=TEMPLATE_CACHE_SIZE)(
+            self._create_jinja_env().from_string
+        )
 
     def get_clickhouse_version(self):
         """
@@ -75,6 +81,7 @@ class ClickhouseClient:
         timeout,
         stream,
         per_query_settings,
+        query_params,
         port,
     ):
         schema = "https" if port == ClickhousePort.HTTPS else "http"
@@ -93,6 +100,10 @@ class ClickhouseClient:
                         **self._settings,
                         "query": query,
                         **per_query_settings,  # overwrites previous settings
+                        **{
+                            f"param_{name}": value
+                            for name, value in query_params.items()
+                        },
                     },
                     headers=headers,
                     json=post_data,
@@ -122,7 +133,7 @@ class ClickhouseClient:
         except requests.exceptions.HTTPError as e:
             raise ClickhouseError(query, e.response) from None
 
-    def _execute_tcp(self, query, format_, port):
+    def _execute_tcp(self, query, format_, query_params, port):
         # Private method, we are sure that port is tcps or tcp and presents in config
         cmd = [
             "clickhouse-client",
@@ -135,6 +146,8 @@ class ClickhouseClient:
             cmd.extend(("--user", self.user))
         if port == ClickhousePort.TCP_SECURE:
             cmd.append("--secure")
+        for name, value in query_params.items():
+            cmd.append(f"--param_{name}={value}")
         masked_cmd = cmd.copy()
         if self.password is not None:
             cmd.extend(("--password", self.password))
@@ -174,9 +187,13 @@ class ClickhouseClient:
         stream: bool = False,
         settings: Optional[dict] = None,
         port: Optional[ClickhousePort] = None,
+        query_params: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """
         Execute query.
+
+        Values of query_params are bound to query parameters in the form
+        "{<name>:<data type>}" on the server side.
         """
         if query_args:
             query = self.render_query(query, **query_args)
@@ -194,6 +211,7 @@ class ClickhouseClient:
             timeout = self._timeout
 
         per_query_settings = settings or {}
+        query_params = query_params or {}
 
         if port is None:
             for i_port in PORTS_PRIORITY:
@@ -213,9 +231,10 @@ class ClickhouseClient:
                 timeout,
                 stream,
                 per_query_settings,
+                query_params,
                 port,
             )
-        return self._execute_tcp(query, format_, port)
+        return self._execute_tcp(query, format_, query_params, port)
 
     def query_json_data(
         self: Self,
@@ -251,6 +270,13 @@ class ClickhouseClient:
         )["data"]
 
     def render_query(self, query, **kwargs):
+        """
+        Render query template. Compiled templates are cached, so repeated queries are
+        not re-parsed.
+        """
+        return self._compile_template(query).render(kwargs)
+
+    def _create_jinja_env(self):
         env = Environment()
 
         env.globals["version_ge"] = lambda version: version_ge(
@@ -259,8 +285,7 @@ class ClickhouseClient:
         env.globals["format_str_match"] = _format_str_match
         env.globals["format_str_imatch"] = _format_str_imatch
 
-        template = env.from_string(query)
-        return template.render(kwargs)
+        return env
 
     def check_port(self, port: ClickhousePort) -> bool:
         return port in self.ports
@@ -1,9 +1,15 @@
+LIKE_SPECIAL_CHARS = ("%", "_", "\\")
+
+
 def _format_str_match(value):
     if value is None:
         return None
 
     if value.find(",") < 0:
-        return f"LIKE '{value}'"
+        # Values without wildcards are matched by equality that is cheaper than LIKE.
+        if any(char in value for char in LIKE_SPECIAL_CHARS):
+            return f"LIKE '{value}'"
+        return f"IN ('{value}')"
 
     return "IN ({0})".format(
         ",".join("'{0}'".format(item.strip()) for item in value.split(","))
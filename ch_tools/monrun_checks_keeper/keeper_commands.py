@@ -1,8 +1,9 @@
+import mmap
 import os
-import re
 import socket
 import ssl
 import time
+from functools import lru_cache
 from typing import Dict
 
 from click import command, pass_context
@@ -16,6 +17,7 @@ DEFAULT_ZOOKEEPER_DATA_DIR = "/var/lib/zookeeper"
 DEFAULT_ZOOKEEPER_DATA_LOG_DIR = "/var/log/zookeeper"
 KEEPER_DEFAULT_PATH = "/var/lib/clickhouse-keeper/snapshots"
 CH_DBMS_DEFAULT_PATH = "/var/lib/clickhouse/snapshots"
+NULL_POINTER_EXCEPTION = b"java.lang.NullPointerException"
 
 context = ssl.create_default_context()
 
@@ -90,16 +92,16 @@ def get_version_command(ctx):
 @command("snapshot")
 def check_snapshots():
     """Check (Zoo)Keeper snapshots"""
-    latest = "No (zoo)keeper snapshots done yet"
     if os.path.exists(ZOOKEEPER_CFG_FILE):
         files = get_snapshot_files(
             read_zookeeper_config().get("dataDir", DEFAULT_ZOOKEEPER_DATA_DIR)
         )
     else:
         files = get_keeper_snapshot_files()
-    if len(files) > 0:
-        latest = sorted(files, key=os.path.getctime, reverse=True)[0]
-    return Result(OK, latest)
+    latest = max(files, key=lambda file: file[1], default=None)
+    if latest is None:
+        return Result(OK, "No (zoo)keeper snapshots done yet")
+    return Result(OK, latest[0])
 
 
 @command("last_null_pointer")
@@ -110,40 +112,87 @@ def check_last_null_pointer_exc():
     if not os.path.exists(ZOOKEEPER_CFG_FILE):
         return Result(OK)
 
-    files = get_zookeeper_log_files_for_last_day()
-    if len(files) == 0:
-        return Result(OK)
-    prev_line = time.strftime(
-        "%Y-%m-%d %H:%M:%S", time.localtime(os.path.getctime(files[0]))
-    )
-    latest = None
-    for file in files:
-        with open(file, encoding="utf-8") as f:
-            for line in f:
-                if "java.lang.NullPointerException" in line:
-                    latest = prev_line.split("[")[0].strip()
-                prev_line = line
+    latest = find_last_null_pointer_exc(get_zookeeper_log_files_for_last_day())
     if latest:
         return Result(WARNING, latest)
     return Result(OK)
 
 
+def find_last_null_pointer_exc(files):
+    """
+    Return the moment of the last NullPointerException in log files ordered by ctime.
+    The moment is taken from the line preceding the exception. None is returned if there
+    is no exception or the line preceding it is blank.
+    """
+    for i in reversed(range(len(files))):
+        found, prev_line = _find_line_before_last_match(
+            files[i], NULL_POINTER_EXCEPTION
+        )
+        if not found:
+            continue
+        if prev_line is None:
+            prev_line = _find_last_line(files[:i])
+        if prev_line is None:
+            prev_line = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(os.path.getctime(files[0]))
+            )
+        return prev_line.split("[")[0].strip() or None
+    return None
+
+
+def _find_line_before_last_match(file, needle):
+    """
+    Search the file for the last occurrence of needle.
+
+    :returns tuple (needle is found, line preceding the matched one).
+      The preceding line is None if the match is on the first line of the file.
+    """
+    if os.path.getsize(file) == 0:
+        return False, None
+    with open(file, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        pos = mm.rfind(needle)
+        if pos < 0:
+            return False, None
+        line_start = mm.rfind(b"\n", 0, pos) + 1
+        if line_start == 0:
+            return True, None
+        prev_line_start = mm.rfind(b"\n", 0, line_start - 1) + 1
+        return True, mm[prev_line_start : line_start - 1].decode("utf-8")
+
+
+def _find_last_line(files):
+    """
+    Return the last line of the last non-empty file or None if all files are empty.
+    """
+    for file in reversed(files):
+        if os.path.getsize(file) == 0:
+            continue
+        with open(file, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with mm:
+            end = len(mm)
+            if mm[end - 1 : end] == b"\n":
+                end -= 1
+            return mm[mm.rfind(b"\n", 0, end) + 1 : end].decode("utf-8")
+    return None
+
+
 def get_zookeeper_log_files_for_last_day():
     """Collect Zookeeper logs for last 24 hours"""
     current_timestamp = time.time()
     logs_path = read_zookeeper_config().get(
         "dataLogDir", DEFAULT_ZOOKEEPER_DATA_LOG_DIR
     )
-    log_files = filter(
-        lambda file: (current_timestamp - os.path.getmtime(file)) < 60 * 60 * 24,
-        [
-            os.path.join(root, name)
-            for root, _, files in os.walk(logs_path)
-            for name in files
-            if name.endswith(".log")
-        ],
-    )
-    return sorted(log_files, key=os.path.getctime)
+    log_files = [
+        (path, ctime)
+        for path, ctime, mtime in _walk_stat(
+            logs_path, lambda name: name.endswith(".log")
+        )
+        if (current_timestamp - mtime) < 60 * 60 * 24
+    ]
+    return [path for path, _ in sorted(log_files, key=lambda file: file[1])]
 
 
 def get_keeper_snapshot_files():
@@ -160,34 +209,75 @@ def get_keeper_snapshot_files():
 
 
 def get_snapshot_files(snapshots_dir):
-    """Select snapshot files in given directory"""
+    """
+    Select snapshot files in given directory.
+
+    :returns list of tuples (file path, file ctime).
+    """
     return [
-        os.path.join(root, name)
-        for root, _, files in os.walk(snapshots_dir)
-        for name in files
-        if name.startswith("snapshot")
+        (path, ctime)
+        for path, ctime, _ in _walk_stat(
+            snapshots_dir, lambda name: name.startswith("snapshot")
+        )
     ]
 
 
+def _walk_stat(root, name_filter):
+    """
+    Walk over directory tree and yield tuple (file path, file ctime, file mtime) for
+    every file which name satisfies name_filter. Each matched file is stat'ed only once.
+    Symlinks to directories are neither followed nor yielded, as with os.walk.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                yield from _walk_stat(entry.path, name_filter)
+            continue
+        if not name_filter(entry.name):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            # The file has been removed after directory listing
+            continue
+        yield entry.path, stat.st_ctime, stat.st_mtime
+
+
 def read_zookeeper_config() -> Dict[str, str]:
     """
     Read Zookeeper configuration file and return content as dict
     """
-    config: Dict[str, str] = {}
     if not os.path.exists(ZOOKEEPER_CFG_FILE):
-        return config
+        return {}
+    return dict(_read_zookeeper_config(os.path.getmtime(ZOOKEEPER_CFG_FILE)))
+
+
+@lru_cache(maxsize=1)
+def _read_zookeeper_config(mtime: float) -> Dict[str, str]:
+    """
+    Parse Zookeeper configuration file.
+    The result is cached by modification time of the file.
+    """
+    # pylint: disable=unused-argument
     with open(ZOOKEEPER_CFG_FILE, encoding="utf-8") as f:
-        for line in f:
-            conf_line = line.split("=")
-            if len(conf_line) > 1:
-                config[conf_line[0].strip()] = conf_line[1].strip()
-    return config
+        return {
+            key.strip(): value.strip()
+            for key, sep, value in (line.partition("=") for line in f)
+            if sep
+        }
 
 
+@lru_cache(maxsize=1)
 def get_keeper_port_pair():
     """
     :returns tuple (port for (Zoo)Keeper, port is secure).
       If no config was found, default (insecure) port 2181 is returned.
+      The result is cached as the config is not expected to change during execution.
     """
     try:
         return ClickhouseKeeperConfig.load().port_pair
@@ -203,6 +293,7 @@ def keeper_command(cmd, timeout, verify_ssl_certs):
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
         sock.settimeout(timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
         if is_secure:
             if not verify_ssl_certs:
@@ -211,11 +302,24 @@ def keeper_command(cmd, timeout, verify_ssl_certs):
             with context.wrap_socket(sock, server_hostname=socket.getfqdn()) as ssock:
                 ssock.connect(("127.0.0.1", port))
                 ssock.sendall(cmd.encode())
-                return ssock.makefile().read(-1)
+                return _recv_all(ssock)
         else:
             sock.connect(("127.0.0.1", port))
             sock.sendall(cmd.encode())
-            return sock.makefile().read(-1)
+            return _recv_all(sock)
+
+
+def _recv_all(sock):
+    """
+    Read data from the socket until the connection is closed by the peer.
+    """
+    chunks = []
+    while True:
+        chunk = sock.recv(8192)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks).decode()
 
 
 def keeper_mntr(ctx):
@@ -231,8 +335,8 @@ def keeper_mntr(ctx):
                 ctx.obj.get("timeout", 3),
                 not ctx.obj.get("no_verify_ssl_certs"),
             )
-            for line in response.split("\n"):
-                key_value = re.split("\\s+", line, 1)
+            for line in response.splitlines():
+                key_value = line.split(None, 1)
                 if len(key_value) == 2:
                     result[key_value[0]] = key_value[1]
 
@@ -2,6 +2,9 @@
 ClickHouse client.
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from typing import Any, Optional, Sequence, Tuple
 
 from requests import HTTPError
@@ -16,16 +19,37 @@ from ch_tools.common.clickhouse.client.error import ClickhouseError
 from . import docker
 from .typing import ContextT
 
+MAX_WORKERS = 8
+
 
 def clickhouse_client(context: ContextT, node_name: str) -> ClickhouseClient:
+    """
+    Return ClickHouse client for the node.
+
+    Clients are cached in the scenario-scoped context, so the exposed port is looked up
+    in Docker only once per node and user.
+    """
+    user = getattr(context, "ch_user", None)
+
+    clients = getattr(context, "clickhouse_clients", None)
+    if clients is None:
+        clients = {}
+        context.clickhouse_clients = clients
+
+    key = (node_name, user)
+    if key not in clients:
+        clients[key] = _create_clickhouse_client(context, node_name, user)
+
+    return clients[key]
+
+
+def _create_clickhouse_client(
+    context: ContextT, node_name: str, user: Optional[str]
+) -> ClickhouseClient:
     protocol = "http"
     port = context.conf["services"]["clickhouse"]["expose"][protocol]
     host, port = docker.get_exposed_port(docker.get_container(context, node_name), port)
 
-    user = None
-    if getattr(context, "ch_user", None) is not None:
-        user = context.ch_user
-
     return ClickhouseClient(
         host=host,
         insecure=True,
@@ -65,15 +89,23 @@ def get_all_user_data(context: ContextT, node: str) -> Tuple[int, dict]:
     """
     Retrieve all user data.
     """
-    user_data = {}
-    rows_count = 0
-    for db_name, table_name, columns in _get_all_user_tables(context, node):
+
+    def _get_table_data(table):
+        db_name, table_name, columns = table
         query = f"""
             SELECT *
             FROM `{db_name}`.`{table_name}`
             ORDER BY {','.join(columns)}
             """
-        table_data = execute_query(context, node, query, format_="JSONCompact")
+        return execute_query(context, node, query, format_="JSONCompact")
+
+    tables = _get_all_user_tables(context, node)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        tables_data = list(executor.map(_get_table_data, tables))
+
+    user_data = {}
+    rows_count = 0
+    for (db_name, table_name, _), table_data in zip(tables, tables_data):
         user_data[".".join([db_name, table_name])] = table_data["data"]
         rows_count += table_data["rows"]
     return rows_count, user_data
@@ -83,13 +115,30 @@ def get_all_user_schemas(context: ContextT, node: str) -> dict:
     """
     Retrieve DDL for user schemas.
     """
+    query = """
+        SELECT
+            database,
+            table,
+            name,
+            type,
+            default_kind,
+            default_expression,
+            comment,
+            compression_codec
+        FROM system.columns
+        WHERE database NOT IN ('system')
+        ORDER BY database, table, position
+        """
+    response = execute_query(context, node, query, format_="JSONCompactEachRow")
+    columns = [json.loads(line) for line in response.splitlines()]
+
     all_tables_desc = {}
-    for db_name, table_name, _ in _get_all_user_tables(context, node):
-        query = f"""
-            DESCRIBE `{db_name}`.`{table_name}`
-            """
-        table_data = execute_query(context, node, query, format_="JSONCompact")
-        all_tables_desc[(db_name, table_name)] = table_data["data"]
+    for (db_name, table_name), table_columns in groupby(
+        columns, key=lambda column: (column[0], column[1])
+    ):
+        all_tables_desc[(db_name, table_name)] = [
+            column[2:] for column in table_columns
+        ]
     return all_tables_desc
 
 
@@ -103,8 +152,7 @@ def get_all_user_databases(context: ContextT, node: str) -> Sequence[str]:
         WHERE name NOT IN ('system')
         """
 
-    databases = execute_query(context, node, query, format_="JSONCompact")["data"]
-    return [db[0] for db in databases]
+    return execute_query(context, node, query, format_="TabSeparated").splitlines()
 
 
 def drop_database(context: ContextT, node: str, db_name: str) -> None:
@@ -114,7 +162,7 @@ def drop_database(context: ContextT, node: str, db_name: str) -> None:
     execute_query(context, node, f"DROP DATABASE {db_name}")
 
 
-def _get_all_user_tables(context: ContextT, node: str) -> dict:
+def _get_all_user_tables(context: ContextT, node: str) -> list:
     query = """
         SELECT
             database,
@@ -125,7 +173,8 @@ def _get_all_user_tables(context: ContextT, node: str) -> dict:
         GROUP BY database, table
         ORDER BY database, table
         """
-    return execute_query(context, node, query, format_="JSONCompact")["data"]
+    response = execute_query(context, node, query, format_="JSONCompactEachRow")
+    return [json.loads(line) for line in response.splitlines()]
 
 
 def execute_query(
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from ch_tools.chadmin.internal import utils
+from ch_tools.chadmin.internal.utils import execute_query
+
+# type: ignore
+
+THREADS = 5
+TIMEOUT = 10
+
+
+class StubClient:
+    def __init__(self, result=None, error=None):
+        self.calls = []
+        self.result = result
+        self.error = error
+        self.release = threading.Event()
+
+    def render_query(self, query, **kwargs):
+        return query.format(**kwargs)
+
+    def query(self, query, **kwargs):
+        self.calls.append(query)
+        self.release.wait(TIMEOUT)
+        if self.error:
+            raise self.error
+        return {"data": [list(self.result)]}
+
+
+@pytest.fixture
+def waiters(monkeypatch):
+    """
+    Count callers waiting for a result of the in-flight query.
+    """
+    waiting = threading.Semaphore(0)
+
+    class CountingFuture(Future):
+        def result(self, timeout=None):
+            waiting.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(utils, "Future", CountingFuture)
+    return waiting
+
+
+def _run_concurrently(monkeypatch, client, waiters, query, **kwargs):
+    monkeypatch.setattr(utils, "clickhouse_client", lambda ctx: client)
+    results = [None] * THREADS
+
+    def _execute(i):
+        try:
+            results[i] = execute_query(None, query, format_="JSON", **kwargs)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=_execute, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for _ in range(THREADS - 1):
+        assert waiters.acquire(timeout=TIMEOUT)
+    client.release.set()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+    return results
+
+
+def test_identical_queries_coalesced(monkeypatch, waiters):
+    client = StubClient(result=[1, 2])
+
+    results = _run_concurrently(
+        monkeypatch, client, waiters, "WITH {x} AS x SELECT x", x=1
+    )
+
+    assert client.calls == ["WITH 1 AS x SELECT x"]
+    assert all(result == {"data": [[1, 2]]} for result in results)
+    assert len({id(result) for result in results}) == THREADS
+    assert len({id(result["data"]) for result in results}) == THREADS
+    assert not utils._inflight_queries
+
+
+def test_error_propagated_to_all_waiters(monkeypatch, waiters):
+    error = RuntimeError("query failed")
+    client = StubClient(error=error)
+
+    results = _run_concurrently(monkeypatch, client, waiters, "SELECT 1")
+
+    assert len(client.calls) == 1
+    assert all(result is error for result in results)
+    assert not utils._inflight_queries
+
+
+@pytest.mark.parametrize(
+    "query, kwargs",
+    [
+        pytest.param("SYSTEM RESTART REPLICA db.t", {}, id="non-select"),
+        pytest.param("SELECT 1", {"stream": True}, id="stream"),
+        pytest.param("SELECT 1", {"echo": True}, id="echo"),
+        pytest.param("SELECT 1", {"dry_run": True}, id="dry run"),
+    ],
+)
+def test_query_not_coalesced(monkeypatch, query, kwargs):
+    client = StubClient(result=[1])
+    client.release.set()
+    monkeypatch.setattr(utils, "clickhouse_client", lambda ctx: client)
+
+    threads = [
+        threading.Thread(target=execute_query, args=(None, query), kwargs=kwargs)
+        for _ in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+    assert len(client.calls) == THREADS
+    assert not utils._inflight_queries
@@ -0,0 +1,23 @@
+import pytest
+
+from ch_tools.chadmin.internal.process import _parse_like_pattern
+
+# type: ignore
+
+
+@pytest.mark.parametrize(
+    "pattern, result",
+    [
+        pytest.param("%foo%", ("contains", "foo"), id="contains"),
+        pytest.param("foo%", ("prefix", "foo"), id="prefix"),
+        pytest.param("%foo", ("suffix", "foo"), id="suffix"),
+        pytest.param("foo", ("equals", "foo"), id="equals"),
+        pytest.param("%f_o%", ("like", "%f_o%"), id="single char wildcard"),
+        pytest.param("%f\\%o%", ("like", "%f\\%o%"), id="escaped wildcard"),
+        pytest.param("%", ("contains", ""), id="match any"),
+        pytest.param("%%", ("contains", ""), id="match any doubled"),
+    ],
+)
+def test_parse_like_pattern(pattern, result):
+
+    assert _parse_like_pattern(pattern) == result
@@ -0,0 +1,19 @@
+import pytest
+
+from ch_tools.common.clickhouse.client.utils import _format_str_match
+
+# type: ignore
+
+
+@pytest.mark.parametrize(
+    "value, result",
+    [
+        pytest.param("db1", "IN ('db1')", id="literal"),
+        pytest.param("db%", "LIKE 'db%'", id="pattern"),
+        pytest.param("db_1", "LIKE 'db_1'", id="single char wildcard"),
+        pytest.param("db1, db2", "IN ('db1','db2')", id="list"),
+    ],
+)
+def test_format_str_match(value, result):
+
+    assert _format_str_match(value) == result
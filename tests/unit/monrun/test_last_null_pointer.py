@@ -0,0 +1,80 @@
+import os
+import time
+
+from hamcrest import assert_that, equal_to
+from pytest import mark
+
+from ch_tools.monrun_checks_keeper.keeper_commands import find_last_null_pointer_exc
+
+EXCEPTION = "java.lang.NullPointerException"
+
+
+def _write_logs(tmp_path, *contents):
+    files = []
+    for i, content in enumerate(contents):
+        path = tmp_path / f"zookeeper{i}.log"
+        path.write_bytes(content.encode())
+        files.append(str(path))
+    return files
+
+
+@mark.parametrize(
+    ["contents", "expected"],
+    [
+        (("2024-01-01 10:00:00,000 [myid:1] - INFO ok\n",), None),
+        (
+            (
+                "2024-01-01 10:00:00,000 [myid:1] - ERROR failed\n"
+                f"{EXCEPTION}\n"
+                "2024-01-01 11:00:00,000 [myid:1] - ERROR failed\n"
+                f"{EXCEPTION}\n"
+                "2024-01-01 12:00:00,000 [myid:1] - INFO ok\n",
+            ),
+            "2024-01-01 11:00:00,000",
+        ),
+        (
+            (
+                "2024-01-01 10:00:00,000 [myid:1] - ERROR failed\n",
+                f"{EXCEPTION}\n2024-01-01 11:00:00,000 [myid:1] - INFO ok\n",
+            ),
+            "2024-01-01 10:00:00,000",
+        ),
+        (
+            (
+                "2024-01-01 10:00:00,000 [myid:1] - ERROR failed\n",
+                "",
+                f"{EXCEPTION}\n",
+            ),
+            "2024-01-01 10:00:00,000",
+        ),
+        (
+            ("2024-01-01 10:00:00,000 [myid:1] - ERROR failed\r\n" f"{EXCEPTION}\r\n",),
+            "2024-01-01 10:00:00,000",
+        ),
+        (
+            (f"2024-01-01 10:00:00,000 [myid:1] - ERROR failed\n\n{EXCEPTION}\n",),
+            None,
+        ),
+    ],
+    ids=[
+        "no exception",
+        "last match wins",
+        "match on first line",
+        "empty file skipped",
+        "crlf",
+        "blank preceding line",
+    ],
+)
+def test_find_last_null_pointer_exc(tmp_path, contents, expected):
+    files = _write_logs(tmp_path, *contents)
+
+    assert_that(find_last_null_pointer_exc(files), equal_to(expected))
+
+
+def test_find_last_null_pointer_exc_ctime_fallback(tmp_path):
+    files = _write_logs(tmp_path, "", f"{EXCEPTION}\n")
+    expected = time.strftime(
+        "%Y-%m-%d %H:%M:%S", time.localtime(os.path.getctime(files[0]))
+    )
+
+    assert_that(find_last_null_pointer_exc(files), equal_to(expected))